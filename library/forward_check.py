@@ -48,6 +48,13 @@ options:
         'Test' will search for the check but it will
         not persist the check.
     required: false
+  facts:
+    description:
+      - Facts gathered by 'forward_facts' (ansible_facts.forward). When provided, network ID, latest snapshot ID
+        and existing checks are taken from the facts instead of being looked up on the Forward server. A check
+        missing from the facts is still looked up on the server before it is added. Updated facts with the added
+        or removed check are returned as 'ansible_facts.forward'.
+    required: false
   mock_snapshot:
     description:
       - Details of the snapshot to upload. Instead of collecting new snapshot, we will upload the snapshot provided with
@@ -78,6 +85,15 @@ EXAMPLES = '''
       ip_proto: tcp
       tp_src: 443
       tp_dst: 88000
+
+- name: Check from device_A to 20.1.1.1 using facts gathered by forward_facts
+  forward_check:
+    network_name: test-network
+    facts: "{{ ansible_facts.forward }}"
+    state: Present
+    data:
+      source: device_A
+      ipv4_dst: 20.1.1.1
 '''
 
 
@@ -94,23 +110,19 @@ STATES = [e.value for e in State]
 TYPES = [e.value for e in Type]
 
 
-# Delete keys from check definition which are not useful for check comparision.
-def cleanup_check_definition(check_definition):
-    try:
-        del check_definition['filters']['from']['type']
-    except KeyError:
-        pass
-    try:
-        del check_definition['name']
-    except KeyError:
-        pass
-    try:
-        del check_definition['note']
-    except KeyError:
-        pass
+# Exit the module, returning facts with the given check index when the check action used facts.
+def exit_check_action(module, facts, network_name, checks, **kwargs):
+    if checks is not None:
+        network_facts = dict(Utils.get_network_facts(facts, network_name), checks=checks)
+        kwargs['ansible_facts'] = {'forward': Utils.set_network_facts(facts, network_name, network_facts)}
+    module.exit_json(**kwargs)
 
 
-def perform_check_action(module, fwd_client_instance, snapshot_id, state, data, name, check_id):
+def perform_check_action(module, fwd_client_instance, snapshot_id, state, data, name, check_id, facts, network_name):
+    checks = None
+    if facts is not None:
+        checks = dict(Utils.get_network_facts(facts, network_name).get('checks') or {})
+
     response = None
     if state is State.PRESENT:
         if 'source' not in data and 'source_host' not in data:
@@ -142,34 +154,42 @@ def perform_check_action(module, fwd_client_instance, snapshot_id, state, data,
         c = check.ExistenceCheck(from_filter, None, name)
 
         check_definition = c.to_check_dict()
-        cleanup_check_definition(check_definition)
+        check_key = Utils.get_check_key(check_definition)
 
-        # If check already exists, don't add it.
+        # If check already exists, don't add it. A check found in facts is confirmed on the server, as it may have
+        # been deleted since the facts were gathered.
+        if checks is not None and check_key in checks:
+            item = fwd_client_instance.get_check(snapshot_id, checks[check_key], verbose=False)
+            if item.get_check_id() is not None:
+                module.exit_json(changed=False, result=item.get_response(),
+                                 message="Matched a check for snapshot %s" % snapshot_id)
+            del checks[check_key]
+
+        # Facts may be stale, so a check missing from them is still looked up on the server before uploading.
+        Utils.cleanup_check_definition(check_definition)
         for item in fwd_client_instance.get_checks(snapshot_id, verbose=False):
             item_definition = item.get_response()['definition']
-            cleanup_check_definition(item_definition)
+            Utils.cleanup_check_definition(item_definition)
             if item_definition['checkType'] == 'Existential' and\
                     sorted(item_definition.items()) == sorted(check_definition.items()):
-                module.exit_json(changed=False, result=item.get_response(),
-                                 message="Matched a check for snapshot %s" % snapshot_id)
+                if checks is not None:
+                    checks[check_key] = item.get_check_id()
+                exit_check_action(module, facts, network_name, checks, changed=False, result=item.get_response(),
+                                  message="Matched a check for snapshot %s" % snapshot_id)
 
         response = fwd_client_instance.upload_check(c, snapshot_id, verbose=False)
-        module.exit_json(changed=(response is not None and response.get_check_id() is not None),
-                         result=response.get_response())
+        changed = response is not None and response.get_check_id() is not None
+        if checks is not None and changed:
+            checks[check_key] = response.get_check_id()
+        exit_check_action(module, facts, network_name, checks, changed=changed, result=response.get_response())
     elif state is State.ABSENT:
         fwd_client_instance.delete_check(snapshot_id, check_id, verbose=False)
         for item in fwd_client_instance.get_checks(snapshot_id, verbose=False):
             if item.get_check_id() == check_id:
                 response = item
-        module.exit_json(changed=(response is None), result=None)
-
-
-def get_latest_snapshot_id(fwd_client_instance, network_id):
-    r = fwd_client_instance.get_snapshots_info(network_id, verbose=False)
-    snapshots = r.get_snapshots()
-    if len(snapshots) == 0:
-        return None
-    return snapshots[0].get_id()
+        if checks is not None and response is None:
+            checks = dict((key, value) for key, value in checks.items() if value != check_id)
+        exit_check_action(module, facts, network_name, checks, changed=(response is None), result=None)
 
 
 def main():
@@ -190,6 +210,7 @@ def main():
             state=dict(type='str', required=False, default=State.PRESENT.value, choices=STATES),
             name=dict(type='str', required=False, default=''),
             check_id=dict(type='int', required=False),
+            facts=dict(type='dict', required=False),
         )
     )
 
@@ -220,18 +241,33 @@ def main():
 
     fwd_client_instance = fwd.Fwd(url, username, password, verbose=False, verify_ssl_cert=False)
 
+    # Facts without a latest snapshot may predate it, so the snapshot is then looked up on the server.
+    network_facts = Utils.get_network_facts(module.params['facts'], network_name)
+    if network_facts is not None and network_facts.get('latest_snapshot_id') is None:
+        network_facts = None
+
     if snapshot_id is None:
         if network_name is None:
             module.fail_json(rc=256, msg="Either network_name or snapshot_id is mandatory for this module")
 
-        network_id = Utils.get_network_id(fwd_client_instance, network_name)
-        if network_id < 0:
-            module.fail_json(rc=256, msg="No network present with given name '%s'." % network_name)
+        if network_facts is not None:
+            snapshot_id = network_facts['latest_snapshot_id']
+        else:
+            network_id = Utils.get_network_id(fwd_client_instance, network_name)
+            if network_id < 0:
+                module.fail_json(rc=256, msg="No network present with given name '%s'." % network_name)
 
-        snapshot_id = get_latest_snapshot_id(fwd_client_instance, network_id)
+            snapshot = Utils.get_latest_snapshot(fwd_client_instance, network_id)
+            if snapshot is not None:
+                snapshot_id = snapshot.get_id()
         if snapshot_id is None:
             module.fail_json(rc=256, msg="No snapshots available in the network.")
 
+    # Checks in facts are only valid for the snapshot they were gathered from.
+    facts = None
+    if network_facts is not None and network_facts['latest_snapshot_id'] == snapshot_id:
+        facts = module.params['facts']
+
     if state is State.ABSENT and check_id is None:
         module.fail_json(rc=256, msg="Check ID is required to delete a check.")
 
@@ -246,7 +282,7 @@ def main():
     if data is None and state is State.PRESENT:
         module.fail_json(rc=256, msg="Check data is not provided.")
 
-    perform_check_action(module, fwd_client_instance, snapshot_id, state, data, name, check_id)
+    perform_check_action(module, fwd_client_instance, snapshot_id, state, data, name, check_id, facts, network_name)
 
 
 # Although PEP-8 prohibits wildcard imports, ansible modules _must_ use them:
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+
+import sys
+import threading
+from multiprocessing.pool import ThreadPool
+from ansible.module_utils.forward import *
+try:
+    from fwd_api import fwd
+except:
+    print('Error importing fwd from fwd_api. Check that you ran ' +
+          'setup (see README).')
+    sys.exit(-1)
+
+# Module documentation for ansible-doc.
+DOCUMENTATION = '''
+---
+module: forward_facts
+short_description: Gathers networks, latest snapshots and checks as ansible facts
+description:
+  - Gathers networks, their latest snapshot and the IDs of the checks of that snapshot in one run and publishes
+    them as 'ansible_facts.forward'. Snapshots and checks of different networks are fetched concurrently.
+  - The result can be passed to 'forward_check' and 'forward_snapshot' with their 'facts' option so they skip their
+    own network, snapshot and check lookups. Those modules return updated facts after taking a snapshot or
+    adding or removing a check.
+  - Works with Ansible fact caching.
+options:
+  properties_file_path:
+    description:
+      - Local properties file name.
+  url:
+    description:
+      - URL of Forward server.
+    required: true
+  username:
+    description:
+      - Username to login to Forward server.
+    required: true
+  password:
+    description:
+      - Password to login to Forward server.
+    required: true
+  network_name:
+    description:
+      - Name of the network for which snapshot and checks will be gathered. If not provided, they are gathered for
+        every network.
+  workers:
+    description:
+      - Number of concurrent API calls.
+    default: 8
+'''
+
+# Example usage for ansible-doc.
+EXAMPLES = '''
+---
+- name: Gather Forward facts
+  forward_facts:
+    url: https://localhost:8443
+    username: admin
+    password: password
+    network_name: test-network
+
+- name: Check from device_A to 20.1.1.1 using gathered facts
+  forward_check:
+    network_name: test-network
+    facts: "{{ ansible_facts.forward }}"
+    data:
+      source: device_A
+      ipv4_dst: 20.1.1.1
+'''
+
+# Example of returned facts.
+RETURN = '''
+---
+ansible_facts:
+  forward:
+    networks:
+      test-network:
+        id: 12
+        latest_snapshot_id: 345
+        latest_snapshot_time: 1546300800000
+        checks:
+          '{"checkType":"Existential",...}': 67
+      other-network:
+        id: 13
+'''
+
+
+# Each worker thread gets its own client; fwd_api does not document its client as thread-safe.
+worker_state = threading.local()
+
+
+def init_worker(url, username, password):
+    worker_state.fwd_client_instance = fwd.Fwd(url, username, password, verbose=False, verify_ssl_cert=False)
+
+
+def get_worker_network_facts(network_id):
+    return get_network_facts(worker_state.fwd_client_instance, network_id)
+
+
+def get_network_facts(fwd_client_instance, network_id):
+    network_facts = {'id': network_id, 'latest_snapshot_id': None, 'latest_snapshot_time': None, 'checks': {}}
+
+    snapshot = Utils.get_latest_snapshot(fwd_client_instance, network_id)
+    if snapshot is None:
+        return network_facts
+
+    network_facts['latest_snapshot_id'] = snapshot.get_id()
+    network_facts['latest_snapshot_time'] = snapshot.get_creation_time()
+    for item in fwd_client_instance.get_checks(snapshot.get_id(), verbose=False):
+        check_key = Utils.get_check_key(item.get_response()['definition'])
+        # Keep the first match, as forward_check does when it looks up checks itself.
+        if check_key not in network_facts['checks']:
+            network_facts['checks'][check_key] = item.get_check_id()
+
+    return network_facts
+
+
+def gather_facts(url, username, password, networks, workers):
+    pool = ThreadPool(min(workers, len(networks)), init_worker, (url, username, password))
+    try:
+        results = pool.map(get_worker_network_facts, list(networks.values()))
+    finally:
+        pool.close()
+        pool.join()
+
+    return dict(zip(networks.keys(), results))
+
+
+def main():
+    '''The entrypoint for this module.
+
+    Prints ansible facts in JSON format on STDOUT and exits.
+    '''
+    module = AnsibleModule(
+        argument_spec=dict(
+            properties_file_path=dict(type='str', required=False),
+            url=dict(type='str', required=False),
+            username=dict(type='str', required=False),
+            password=dict(type='str', required=False, no_log=True),
+            network_name=dict(type='str', required=False),
+            workers=dict(type='int', required=False, default=8),
+        )
+    )
+
+    properties_file_path = module.params['properties_file_path']
+    properties = Properties(module, properties_file_path)
+
+    url = properties.get_url()
+    if url is None:
+        module.fail_json(rc=256, msg="Forward server URL is not provided.")
+
+    username = properties.get_username()
+    if username is None:
+        module.fail_json(rc=256, msg="Username to login to Forward server is not provided.")
+
+    password = properties.get_password()
+    if password is None:
+        module.fail_json(rc=256, msg="Password to login to Forward server is not provided.")
+
+    workers = module.params['workers']
+    if workers < 1:
+        module.fail_json(rc=256, msg="Number of workers must be at least 1.")
+
+    fwd_client_instance = fwd.Fwd(url, username, password, verbose=False, verify_ssl_cert=False)
+
+    networks = Utils.get_networks(fwd_client_instance)
+
+    network_name = properties.get_network_name()
+    if network_name is not None:
+        if network_name not in networks:
+            module.fail_json(rc=256, msg="No network present with given name '%s'." % network_name)
+        gathered_networks = {network_name: networks[network_name]}
+    else:
+        gathered_networks = networks
+
+    network_facts = {}
+    for name, network_id in networks.items():
+        network_facts[name] = {'id': network_id}
+    if len(gathered_networks) != 0:
+        network_facts.update(gather_facts(url, username, password, gathered_networks, workers))
+
+    module.exit_json(changed=False, ansible_facts={'forward': {'networks': network_facts}})
+
+# Although PEP-8 prohibits wildcard imports, ansible modules _must_ use them:
+# https://github.com/ansible/ansible/blob/devel/lib/ansible/module_common.py#L116
+from ansible.module_utils.basic import *  # noqa
+main()
@@ -51,6 +51,11 @@ options:
     description:
       - Details of the snapshot to upload. Instead of collecting new snapshot, we will upload the snapshot provided with
         this option.
+  facts:
+    description:
+      - Facts gathered by 'forward_facts' (ansible_facts.forward). When provided, network ID and latest snapshot are
+        taken from the facts instead of being looked up on the Forward server. When a new snapshot is taken or
+        uploaded, updated facts pointing to it are returned as 'ansible_facts.forward'.
 '''
 
 # Example usage for ansible-doc.
@@ -78,6 +83,13 @@ EXAMPLES = '''
     devices:
       - sjc-te-fw01
       - atl-edge-fw01
+
+- name: Ensure up-to-date network collection using facts gathered by forward_facts
+  forward_snapshot:
+    network_name: test-network
+    facts: "{{ ansible_facts.forward }}"
+    freshness: 10m
+    type: collect
 '''
 
 
@@ -101,15 +113,10 @@ def parse_freshness(module, freshness):
     return seconds
 
 
-def get_snapshots(fwd_client_instance, network_id):
-    r = fwd_client_instance.get_snapshots_info(network_id, verbose=False)
-    return r.get_snapshots()
-
-
-def is_latest_snapshot_non_fresh(snapshots, freshness_duration):
-    if len(snapshots) == 0:
+def is_latest_snapshot_non_fresh(latest_snapshot_time, freshness_duration):
+    if latest_snapshot_time is None:
         return True
-    snapshot_create_time = snapshots[0].get_creation_time() / 1000
+    snapshot_create_time = latest_snapshot_time / 1000
     elapsed_time = time.time() - snapshot_create_time
     if freshness_duration < elapsed_time:
         return True
@@ -121,8 +128,7 @@ def upload_snapshot(fwd_client_instance, network_id, mock_snapshot):
     return fwd_client_instance.upload_snapshot(network_id, mock_snapshot['path'], mock_snapshot['name'])
 
 
-def take_snapshot(fwd_client_instance, network_id, snapshots, devices, wait_time):
-    latest_snapshot = snapshots[0] if len(snapshots) != 0 else None
+def take_snapshot(fwd_client_instance, network_id, latest_snapshot_id, devices, wait_time):
     if not fwd_client_instance.take_snapshot(network_id, devices):
         return None
 
@@ -131,12 +137,12 @@ def take_snapshot(fwd_client_instance, network_id, snapshots, devices, wait_time
         if wait_time is not None:
             wait_time -= 10
 
-    snapshots = get_snapshots(fwd_client_instance, network_id)
-    if len(snapshots) < 1:
+    snapshot = Utils.get_latest_snapshot(fwd_client_instance, network_id)
+    if snapshot is None:
         return None
-    if snapshots[0].get_id() == latest_snapshot.get_id():
+    if snapshot.get_id() == latest_snapshot_id:
         return None
-    return snapshots[0]
+    return snapshot
 
 
 def main():
@@ -156,6 +162,7 @@ def main():
             devices=dict(type='list', required=False),
             mock_snapshot=dict(type='dict', required=False),
             wait_time=dict(type='int', required=False),
+            facts=dict(type='dict', required=False),
         )
     )
 
@@ -185,20 +192,32 @@ def main():
     if freshness is not None:
         freshness_duration = parse_freshness(module, freshness)
 
-    network_id = Utils.get_network_id(fwd_client_instance, network_name)
-    if network_id < 0:
-        module.fail_json(rc=256, msg="No network present with given name '%s'." % network_name)
+    # Facts without a latest snapshot may predate it, so the snapshot is then looked up on the server.
+    network_facts = Utils.get_network_facts(module.params['facts'], network_name)
+    if network_facts is not None and network_facts.get('latest_snapshot_id') is not None:
+        network_id = network_facts['id']
+        latest_snapshot_id = network_facts['latest_snapshot_id']
+        latest_snapshot_time = network_facts['latest_snapshot_time']
+    else:
+        network_id = Utils.get_network_id(fwd_client_instance, network_name)
+        if network_id < 0:
+            module.fail_json(rc=256, msg="No network present with given name '%s'." % network_name)
+
+        latest_snapshot_id = None
+        latest_snapshot_time = None
+        latest_snapshot = Utils.get_latest_snapshot(fwd_client_instance, network_id)
+        if latest_snapshot is not None:
+            latest_snapshot_id = latest_snapshot.get_id()
+            latest_snapshot_time = latest_snapshot.get_creation_time()
 
     wait_time = module.params['wait_time']
     devices = module.params['devices']
 
-    snapshots = get_snapshots(fwd_client_instance, network_id)
-
-    if is_latest_snapshot_non_fresh(snapshots, freshness_duration):
+    if is_latest_snapshot_non_fresh(latest_snapshot_time, freshness_duration):
         new_snapshot = None
         snapshot_type = module.params['type']
         if snapshot_type == 'collect':
-            new_snapshot = take_snapshot(fwd_client_instance, network_id, snapshots, devices, wait_time)
+            new_snapshot = take_snapshot(fwd_client_instance, network_id, latest_snapshot_id, devices, wait_time)
         elif snapshot_type == 'mock':
             mock_snapshot = module.params['mock_snapshot']
             if mock_snapshot is None:
@@ -215,10 +234,21 @@ def main():
             module.exit_json(changed=False, failed=True)
 
         snapshot_link = "%s/?/search?networkId=%d&snapshotId=%d" % (url, network_id, new_snapshot.get_id())
-        module.exit_json(changed=True, snapshot_id=new_snapshot.get_id(), snapshot_link=snapshot_link)
 
-    snapshot_link = "%s/?/search?networkId=%d&snapshotId=%d" % (url, network_id, snapshots[0].get_id())
-    module.exit_json(changed=False, snapshot_id=snapshots[0].get_id(), snapshot_link=snapshot_link)
+        # Point the given facts at the new snapshot so later tasks don't use the previous one.
+        facts = module.params['facts']
+        if facts is None:
+            module.exit_json(changed=True, snapshot_id=new_snapshot.get_id(), snapshot_link=snapshot_link)
+
+        facts = Utils.set_network_facts(facts, network_name, {'id': network_id,
+                                                              'latest_snapshot_id': new_snapshot.get_id(),
+                                                              'latest_snapshot_time': new_snapshot.get_creation_time(),
+                                                              'checks': {}})
+        module.exit_json(changed=True, snapshot_id=new_snapshot.get_id(), snapshot_link=snapshot_link,
+                         ansible_facts={'forward': facts})
+
+    snapshot_link = "%s/?/search?networkId=%d&snapshotId=%d" % (url, network_id, latest_snapshot_id)
+    module.exit_json(changed=False, snapshot_id=latest_snapshot_id, snapshot_link=snapshot_link)
 
 # Although PEP-8 prohibits wildcard imports, ansible modules _must_ use them:
 # https://github.com/ansible/ansible/blob/devel/lib/ansible/module_common.py#L116
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import copy
+import json
 import os.path
 
 
@@ -91,3 +93,55 @@ class Utils:
                 result.append({'name': network.get_name(), 'id': network.get_id()})
 
         return result
+
+    @staticmethod
+    def get_networks(fwd_client_instance):
+        result = {}
+        for network in fwd_client_instance.get_networks_info(verbose=False):
+            result[network.get_name()] = network.get_id()
+
+        return result
+
+    @staticmethod
+    def get_latest_snapshot(fwd_client_instance, network_id):
+        r = fwd_client_instance.get_snapshots_info(network_id, verbose=False)
+        snapshots = r.get_snapshots()
+        if len(snapshots) == 0:
+            return None
+        return snapshots[0]
+
+    # Delete keys from check definition which are not useful for check comparision.
+    @staticmethod
+    def cleanup_check_definition(check_definition):
+        try:
+            del check_definition['filters']['from']['type']
+        except KeyError:
+            pass
+        try:
+            del check_definition['name']
+        except KeyError:
+            pass
+        try:
+            del check_definition['note']
+        except KeyError:
+            pass
+
+    # Canonical form of a check definition, used to index checks in forward facts.
+    @staticmethod
+    def get_check_key(check_definition):
+        definition = copy.deepcopy(check_definition)
+        Utils.cleanup_check_definition(definition)
+        return json.dumps(definition, sort_keys=True, separators=(',', ':'))
+
+    @staticmethod
+    def get_network_facts(facts, network_name):
+        if facts is None or network_name is None:
+            return None
+        return facts.get('networks', {}).get(network_name)
+
+    # Copy of facts with the given network's facts replaced, to return updated facts from a module.
+    @staticmethod
+    def set_network_facts(facts, network_name, network_facts):
+        facts = copy.deepcopy(facts)
+        facts.setdefault('networks', {})[network_name] = network_facts
+        return facts